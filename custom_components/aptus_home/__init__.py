@@ -4,41 +4,85 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
-from .aptus_client import AptusClient
+from .aptus_client import USER_AGENT, AptusClient
+from .coordinator import AptusHomeCoordinator
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 _PLATFORMS: list[Platform] = [Platform.LOCK]
 
-type AptusHomeConfigEntry = ConfigEntry[AptusClient]
+type AptusHomeConfigEntry = ConfigEntry[AptusHomeCoordinator]
+
+# Clients are cached across entry reloads so the warm connection pool and
+# its TLS session survive HA's frequent unload/setup cycles.
+_CLIENT_CACHE: dict[tuple[str, str], AptusClient] = {}
+
+
+async def _async_evict_client(cache_key: tuple[str, str]) -> None:
+    """
+    Drop a cached client and close its session.
+
+    The session is created with auto_cleanup=False, so nothing else will
+    close it — including client.close(), which leaves injected sessions
+    alone.
+    """
+    client = _CLIENT_CACHE.pop(cache_key, None)
+    if client is None:
+        return
+    if client.session is not None and not client.session.closed:
+        await client.session.close()
+    client.session = None
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: AptusHomeConfigEntry) -> bool:
     """Set up Aptus Home from a config entry."""
-    # Create API instance
-    client = AptusClient(
-        base_url=entry.data[CONF_HOST],
-        username=entry.data[CONF_USERNAME],
-        password=entry.data[CONF_PASSWORD],
-    )
+    # Reuse a cached API instance if this host was set up before
+    cache_key = (entry.data[CONF_HOST], entry.data[CONF_USERNAME])
+    client = _CLIENT_CACHE.get(cache_key)
+    if client is None:
+        # auto_cleanup=False keeps HA from closing the session on entry
+        # unload — the whole point of the cache is that the warm pool
+        # survives reloads — so eviction must close it explicitly. The
+        # client needs its own cookie jar since the portal login is
+        # cookie-based
+        session = async_create_clientsession(
+            hass,
+            auto_cleanup=False,
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
+            headers={"User-Agent": USER_AGENT},
+        )
+        client = AptusClient(
+            base_url=entry.data[CONF_HOST],
+            username=entry.data[CONF_USERNAME],
+            password=entry.data[CONF_PASSWORD],
+            session=session,
+        )
+        _CLIENT_CACHE[cache_key] = client
+    else:
+        client.password = entry.data[CONF_PASSWORD]
 
     # Validate the API connection and authentication
     try:
-        login_success = await hass.async_add_executor_job(client.login)
+        login_success = await client.login()
         if not login_success:
             msg = "Failed to authenticate with Aptus Home"
             raise ConfigEntryNotReady(msg)  # noqa: TRY301
     except Exception as err:
+        await _async_evict_client(cache_key)
         msg = f"Failed to connect to Aptus Home: {err}"
         raise ConfigEntryNotReady(msg) from err
 
-    # Store API object for platforms to access
-    entry.runtime_data = client
+    # One coordinator polls the portal per cycle for all lock entities
+    coordinator = AptusHomeCoordinator(hass, entry, client)
+    await coordinator.async_config_entry_first_refresh()
+    entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
 
@@ -47,8 +91,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: AptusHomeConfigEntry) ->
 
 async def async_unload_entry(hass: HomeAssistant, entry: AptusHomeConfigEntry) -> bool:
     """Unload a config entry."""
-    # Logout from the API
+    # Log out but keep the client and its session cached for the next
+    # setup of this host, so a reload does not pay a fresh TLS handshake
     if entry.runtime_data:
-        await hass.async_add_executor_job(entry.runtime_data.logout)
+        await entry.runtime_data.client.logout()
 
     return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: AptusHomeConfigEntry,
+) -> None:
+    """Close and forget the cached client when the entry is removed."""
+    await _async_evict_client((entry.data[CONF_HOST], entry.data[CONF_USERNAME]))
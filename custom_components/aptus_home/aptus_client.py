@@ -1,11 +1,137 @@
 """AptusPortal API Client for Home Assistant integration."""
 
-import json
+import asyncio
+import html
+import re
+import time
+from email.utils import parsedate_to_datetime
 from typing import Any
-from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import orjson
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# bs4 (and lxml behind it) only serve the fallback parse paths since the
+# regex/selectolax fast paths landed, so defer their import cost out of
+# integration startup. Populated by _ensure_bs4() on first use.
+_BeautifulSoup = None
+_BS4_PARSER: str | None = None
+_LOGIN_INPUTS = None
+_LOCK_CARDS = None
+_TOKEN_SELECTOR = None
+_SALT_SELECTOR = None
+
+# Compiled on the first lxml fallback parse and cached so repeat polls
+# skip XPath expression parsing. Lazy for the same reason as the bs4
+# helpers: lxml stays off the startup path.
+_ENTRANCE_CARDS_XPATH = None
+
+
+def _ensure_bs4() -> None:
+    """Import BeautifulSoup and compile its helpers on first use."""
+    global _BeautifulSoup, _BS4_PARSER, _LOGIN_INPUTS  # noqa: PLW0603
+    global _LOCK_CARDS, _TOKEN_SELECTOR, _SALT_SELECTOR  # noqa: PLW0603
+
+    if _BeautifulSoup is not None:
+        return
+
+    try:
+        import soupsieve
+        from bs4 import BeautifulSoup, SoupStrainer
+    except ImportError as err:
+        msg = "beautifulsoup4 is required to parse AptusPortal HTML"
+        raise AptusDependencyError(msg) from err
+
+    try:
+        import lxml  # noqa: F401
+
+        _BS4_PARSER = "lxml"
+    except ImportError:
+        _BS4_PARSER = "html.parser"
+
+    # Restrict login-page parsing to the two hidden inputs we actually
+    # read; everything else on the page is skipped at parse time.
+    _LOGIN_INPUTS = SoupStrainer(
+        "input", attrs={"name": ["__RequestVerificationToken", "PasswordSalt"]}
+    )
+
+    # Likewise, the Lock page parse only ever reads the lockCard divs. A
+    # regex keeps cards with extra classes (e.g. "lockCard big"), which a
+    # plain string match would drop at parse time.
+    _LOCK_CARDS = SoupStrainer("div", class_=re.compile(r"\blockCard\b"))
+
+    # Compiled once so repeat parses skip selector parsing and bs4's
+    # Python-level attribute matching.
+    _TOKEN_SELECTOR = soupsieve.compile('input[name="__RequestVerificationToken"]')
+    _SALT_SELECTOR = soupsieve.compile('input[name="PasswordSalt"]')
+
+    _BeautifulSoup = BeautifulSoup
+
+
+# Fast path for the login page: the token and salt are plain hidden inputs,
+# so a regex scan avoids DOM construction entirely. Both attribute orders
+# are accepted in case the portal template changes. The patterns match on
+# raw bytes so the body never needs a charset decode pass.
+_TOKEN_RE = re.compile(
+    rb'name="__RequestVerificationToken"[^>]*value="([^"]+)"'
+    rb'|value="([^"]+)"[^>]*name="__RequestVerificationToken"'
+)
+_SALT_RE = re.compile(
+    rb'id="PasswordSalt"[^>]*value="([^"]+)"'
+    rb'|value="([^"]+)"[^>]*id="PasswordSalt"'
+)
+
+# Template-specific fast path for the Lock page: one pass over the raw
+# bytes pulls the card id, main name and optional sub-name span with zero
+# tree construction. Brittle against template changes by design — callers
+# fall back to a real parser when it matches nothing.
+_LOCK_CARD_RE = re.compile(
+    rb'<div[^>]*class="[^"]*lockCard[^"]*"[^>]*id="(entranceDoor_(\d+))"[^>]*>\s*'
+    rb"<div[^>]*>\s*([^<]+?)\s*(?:<span[^>]*>([^<]*)</span>\s*)?<",
+    re.DOTALL,
+)
+
+# Retry transient gateway errors with backoff instead of failing a poll on
+# the first hiccup.
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303})
+
+# Timeout objects are immutable, so build them once instead of per call.
+_API_TIMEOUT = aiohttp.ClientTimeout(total=15)
+_PAGE_TIMEOUT = aiohttp.ClientTimeout(total=20)
+
+# Browser-like headers for the HTML page fetches (login page and logout),
+# assembled once instead of per call.
+_PAGE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/97.0.4692.99 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,"
+    "image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
+    "Accept-Language": "en-US,en;q=0.9",
+    # br is only honored because Brotli is in the manifest requirements;
+    # without the decoder aiohttp would choke on a brotli body.
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# Built once: every API call sends the same single extra header, and the
+# Lock page fetch must be able to omit it, so it stays a per-request
+# override rather than a session default.
+_XHR_HEADERS = {"X-Requested-With": "XMLHttpRequest"}
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 "
+    "Safari/537.36."
+)
 
 
 class AptusError(Exception):
@@ -42,98 +168,234 @@ class AptusDependencyError(AptusError):
 
 
 class AptusClient:
-    """A Python client to interact with the AptusPortal API."""
+    """An async Python client to interact with the AptusPortal API."""
+
+    # Tokens are regenerated per server session, so only trust a cached
+    # login-page parse for a short window.
+    _LOGIN_PAGE_CACHE_TTL = 60.0
+
+    # The lock-status temp data is session-scoped server side; refreshing
+    # it on every poll just doubles the RTT of each status check.
+    _TEMP_DATA_TTL = 30.0
+
+    # Re-login this many seconds before the session cookie expires rather
+    # than waiting for a request to bounce off the login redirect.
+    _LOGIN_EXPIRY_MARGIN = 30.0
 
     def __init__(
         self,
         base_url: str,
         username: str | None = None,
         password: str | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
-        """Initialize the AptusClient with base URL, username, and password."""
+        """
+        Initialize the AptusClient with base URL, username, and password.
+
+        An externally managed aiohttp session (e.g. one created through
+        Home Assistant's aiohttp_client helpers) can be injected; the
+        client then never closes it.
+        """
         self.base_url: str = base_url
-        self.session: requests.Session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 "
-                "Safari/537.36.",
-            }
-        )
+        # Endpoints are always relative to the portal root, so URL joins
+        # reduce to prefixing this slash-terminated base.
+        self._base: str = base_url if base_url.endswith("/") else base_url + "/"
+        self.session: aiohttp.ClientSession | None = session
+        self._owns_session: bool = session is None
         self.username: str | None = username
         self.password: str | None = password
         self._logged_in: bool = False
         self._request_verification_token: str | None = None
         self._password_salt: str | None = None
+        self._login_page_etag: str | None = None
+        self._login_page_last_modified: str | None = None
+        self._login_page_fetched_at: float | None = None
+        self._xor_key: int | None = None
+        self._xor_table: dict[int, int] = {}
+        self._last_temp_data_ts: float | None = None
+        self._login_expires_at: float | None = None
+        # Endpoints are a small fixed set (plus one URL per lock id), so
+        # memoize the joined URLs instead of re-parsing base_url each call.
+        self._url_cache: dict[str, str] = {}
+        # The logout Referer is fixed per portal, so the full header dict
+        # can be assembled up front too.
+        self._logout_headers: dict[str, str] = {
+            **_PAGE_HEADERS,
+            "Referer": self._make_url("Lock"),
+        }
 
-    def _make_url(self, endpoint: str) -> str:
-        return urljoin(self.base_url, endpoint)
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the client session, creating an owned one on first use."""
+        if self.session is None or self.session.closed:
+            # The client only ever talks to one portal host, so a small pool
+            # is plenty; TCP_NODELAY is aiohttp's default and the long
+            # keep-alive keeps the TLS connection warm between poll cycles.
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=4,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                ),
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                headers={"User-Agent": USER_AGENT},
+            )
+            self._owns_session = True
+        return self.session
 
-    def _encrypt_password(self, password_str: str, salt_str: str | None) -> str:
-        """Replicates the XOR encryption logic from pwEnc.js."""
-        if not salt_str:
-            salt_str = "611"
+    async def close(self) -> None:
+        """Close the underlying HTTP session if this client owns it."""
+        if self._owns_session and self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
 
+    def _make_url(self, endpoint: str) -> str:
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._base + endpoint.lstrip("/")
+            self._url_cache[endpoint] = url
+        return url
+
+    def _prime_xor_table(self, salt_str: str | None) -> int:
+        """
+        Derive the XOR key from the salt and cache its translation table.
+
+        Called as soon as the salt is scraped so the table build stays out
+        of the encryption path; returns the derived key.
+        """
         try:
-            key = int(salt_str)
+            key = int(salt_str) if salt_str else 611
         except ValueError:
             key = 611
 
-        encrypted_chars = []
-        for char_in_password in password_str:
-            char_code = ord(char_in_password)
-            encrypted_char_code = key ^ char_code
-            encrypted_chars.append(chr(encrypted_char_code))
+        if key != self._xor_key:
+            self._xor_table = {c: key ^ c for c in range(128)}
+            self._xor_key = key
+        return key
 
-        return "".join(encrypted_chars)
+    def _encrypt_password(self, password_str: str, salt_str: str | None) -> str:
+        """Replicates the XOR encryption logic from pwEnc.js."""
+        key = self._prime_xor_table(salt_str)
 
-    def _get_login_page_details(self) -> bool:
-        login_page_url = self._make_url("Account/Login")
+        if not password_str:
+            return ""
 
-        fetch_headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/97.0.4692.99 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,"
-            "image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        if password_str.isascii():
+            # str.translate applies the cached table in a single C loop.
+            return password_str.translate(self._xor_table)
 
+        # XOR every code point in one pass: widen to UTF-32 words and let
+        # CPython's C integer XOR do the work instead of a per-character
+        # Python loop. The salt can exceed one byte (the default is 611),
+        # so this operates on 32-bit words rather than single bytes.
         try:
-            response = self.session.get(
-                login_page_url, timeout=20, headers=fetch_headers, allow_redirects=True
+            raw = password_str.encode("utf-32-le")
+            count = len(raw) // 4
+            mask = int.from_bytes(
+                (key & 0xFFFFFFFF).to_bytes(4, "little") * count, "little"
             )
+            xored = int.from_bytes(raw, "little") ^ mask
+            return xored.to_bytes(count * 4, "little").decode("utf-32-le")
+        except UnicodeError:
+            # UTF-32 cannot round-trip surrogates — the input may contain
+            # a lone one (JSON config storage preserves them) and the XOR
+            # may produce one; fall back to per-character chr() semantics
+            # either way.
+            return "".join(chr(key ^ ord(c)) for c in password_str)
+
+    async def _get_login_page_details(self) -> bool:
+        login_page_url = self._make_url("Account/Login")
 
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            token_input = soup.find("input", {"name": "__RequestVerificationToken"})
-            if token_input and token_input.get("value"):  # type: ignore  # noqa: PGH003
-                self._request_verification_token = token_input["value"]  # type: ignore  # noqa: PGH003
-            else:
-                return False
+        fetch_headers = _PAGE_HEADERS
 
-            salt_input = soup.find(
-                "input", {"id": "PasswordSalt", "name": "PasswordSalt"}
-            )
-            if salt_input and salt_input.get("value"):  # type: ignore  # noqa: PGH003
-                self._password_salt = salt_input["value"]  # type: ignore  # noqa: PGH003
-            else:
-                self._password_salt = "611"  # noqa: S105
+        revalidate = False
+        if (
+            self._request_verification_token is not None
+            and self._login_page_fetched_at is not None
+        ):
+            if (
+                time.monotonic() - self._login_page_fetched_at
+                < self._LOGIN_PAGE_CACHE_TTL
+            ):
+                # Fresh enough to reuse without any network traffic; this
+                # saves the whole round trip on reactive re-logins.
+                return True
+            # Stale: revalidate with conditional headers so an unchanged
+            # page costs a 304 instead of a parse. Only this path copies
+            # the shared header dict.
+            fetch_headers = dict(_PAGE_HEADERS)
+            if self._login_page_etag:
+                fetch_headers["If-None-Match"] = self._login_page_etag
+            if self._login_page_last_modified:
+                fetch_headers["If-Modified-Since"] = self._login_page_last_modified
+            revalidate = True
+
+        session = await self._ensure_session()
+        try:
+            async with session.get(
+                login_page_url,
+                timeout=_PAGE_TIMEOUT,
+                headers=fetch_headers,
+                allow_redirects=True,
+            ) as response:
+                if revalidate and response.status == 304:  # noqa: PLR2004
+                    # Page unchanged since last fetch; reuse the cached
+                    # token/salt and restart its freshness window.
+                    self._login_page_fetched_at = time.monotonic()
+                    return True
+
+                if response.status >= 400:  # noqa: PLR2004
+                    return False
+
+                # Work on the raw bytes; both the regexes and the bs4
+                # fallback handle them directly, skipping a charset decode
+                # of the whole page.
+                page_bytes = await response.read()
+                token_match = _TOKEN_RE.search(page_bytes)
+                if token_match:
+                    token_value = (token_match.group(1) or token_match.group(2)).decode(
+                        "utf-8", "replace"
+                    )
+                    salt_match = _SALT_RE.search(page_bytes)
+                    salt_value = (
+                        (salt_match.group(1) or salt_match.group(2)).decode(
+                            "utf-8", "replace"
+                        )
+                        if salt_match
+                        else None
+                    )
+                else:
+                    # Unexpected markup; fall back to a real HTML parse.
+                    token_value, salt_value = self._parse_login_inputs_bs4(page_bytes)
+
+                if not token_value:
+                    return False
+                self._request_verification_token = token_value
+                self._password_salt = salt_value or "611"
+                self._prime_xor_table(self._password_salt)
+                self._login_page_etag = response.headers.get("ETag")
+                self._login_page_last_modified = response.headers.get("Last-Modified")
+                self._login_page_fetched_at = time.monotonic()
 
-            return True  # noqa: TRY300
+                return True
 
-        except requests.exceptions.TooManyRedirects:
-            return False
-        except requests.exceptions.HTTPError:
-            return False
-        except requests.exceptions.RequestException:
+        except (aiohttp.ClientError, TimeoutError):
             return False
 
-    def login(self, username: str | None = None, password: str | None = None) -> bool:
+    def _parse_login_inputs_bs4(
+        self, page_bytes: bytes
+    ) -> tuple[str | None, str | None]:
+        """Extract the token and salt inputs with BeautifulSoup (fallback path)."""
+        _ensure_bs4()
+        soup = _BeautifulSoup(page_bytes, _BS4_PARSER, parse_only=_LOGIN_INPUTS)  # type: ignore  # noqa: PGH003
+        token_input = _TOKEN_SELECTOR.select_one(soup)  # type: ignore  # noqa: PGH003
+        salt_input = _SALT_SELECTOR.select_one(soup)  # type: ignore  # noqa: PGH003
+        token_value = token_input.get("value") if token_input else None  # type: ignore  # noqa: PGH003
+        salt_value = salt_input.get("value") if salt_input else None  # type: ignore  # noqa: PGH003
+        return token_value, salt_value
+
+    async def login(
+        self, username: str | None = None, password: str | None = None
+    ) -> bool:
         """Login to the AptusPortal with provided username and password."""
         if username:
             self.username = username
@@ -143,7 +405,7 @@ class AptusClient:
         if not self.username or not self.password:
             return False
 
-        if not self._get_login_page_details():
+        if not await self._get_login_page_details():
             return False
 
         if not self._request_verification_token or not self._password_salt:
@@ -164,243 +426,413 @@ class AptusClient:
             "PasswordSalt": self._password_salt,
         }
 
-        post_headers = dict(self.session.headers)
-        post_headers.pop("X-Requested-With", None)
-        post_headers["Content-Type"] = "application/x-www-form-urlencoded"
-        post_headers["Referer"] = self._make_url("Account/Login")
+        post_headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Referer": self._make_url("Account/Login"),
+        }
 
+        session = await self._ensure_session()
         try:
-            response = self.session.post(
+            async with session.post(
                 self._make_url(login_endpoint),
                 params=login_url_params,
                 data=payload,
                 headers=post_headers,
-                timeout=15,
-                allow_redirects=True,
-            )
-            response.raise_for_status()
-
-            if "Account/Login" in response.url:
-                self._logged_in = False
-                return False
-
-            if (
-                "Log ud" in response.text
-                or "L&#229;s" in response.text
-                or "Lås" in response.text
-            ):
-                self._logged_in = True
-                self.session.headers["X-Requested-With"] = "XMLHttpRequest"
-                return True
-            self._logged_in = False
-            return False  # noqa: TRY300
-
-        except requests.exceptions.HTTPError:
-            self._logged_in = False
-            return False
-        except requests.exceptions.RequestException:
+                timeout=_API_TIMEOUT,
+                allow_redirects=False,
+            ) as response:
+                if response.status >= 400:  # noqa: PLR2004
+                    self._logged_in = False
+                    return False
+
+                # Failed logins land back on Account/Login; anything else
+                # means the portal accepted the credentials and redirected
+                # to the dashboard. The redirect target alone carries that
+                # signal, so the dashboard it points at is never fetched.
+                if response.status in _REDIRECT_STATUSES:
+                    target = response.headers.get("Location", "")
+                else:
+                    target = str(response.url)
+                self._logged_in = "Account/Login" not in target
+                if self._logged_in:
+                    self._update_login_expiry()
+                else:
+                    # The cached token may have gone stale; force a fresh
+                    # login-page fetch on the next attempt.
+                    self._request_verification_token = None
+                    self._login_page_fetched_at = None
+                return self._logged_in
+
+        except (aiohttp.ClientError, TimeoutError):
             self._logged_in = False
             return False
 
-    def _request(
+    def _update_login_expiry(self) -> None:
+        """Record the earliest session-cookie expiry after a login."""
+        self._login_expires_at = None
+        if self.session is None:
+            return
+        expiries = []
+        for cookie in self.session.cookie_jar:
+            expires = cookie.get("expires")
+            if not expires:
+                continue
+            try:
+                expiries.append(parsedate_to_datetime(expires).timestamp())
+            except (TypeError, ValueError):
+                continue
+        if expiries:
+            self._login_expires_at = min(expiries)
+
+    def _login_expiring_soon(self) -> bool:
+        """Return True when the session cookie is about to lapse."""
+        return (
+            self._login_expires_at is not None
+            and time.time() > self._login_expires_at - self._LOGIN_EXPIRY_MARGIN
+        )
+
+    async def _request(  # noqa: PLR0913
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         expect_json: bool = True,  # noqa: FBT001, FBT002
+        discard_body: bool = False,  # noqa: FBT001, FBT002
     ) -> dict[str, Any] | str:
         if not self._logged_in and not endpoint.startswith("Account/Login"):
             return {"error": "NotLoggedIn", "message": "User is not logged in."}
 
         url = self._make_url(endpoint)
+        session = await self._ensure_session()
 
-        current_headers = dict(self.session.headers)
-        current_headers["X-Requested-With"] = "XMLHttpRequest"
-
-        try:
-            response = self.session.request(
-                method,
-                url,
-                params=params,
-                data=data,
-                headers=current_headers,
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            if expect_json:
-                try:
-                    return response.json()
-                except json.JSONDecodeError:
-                    return {"raw_text": response.text, "error": "JSONDecodeError"}
-            else:
-                return response.text
-        except requests.exceptions.HTTPError as e:
+        last_error: dict[str, Any] = {
+            "error": "RequestException",
+            "message": "Retries exhausted.",
+        }
+        for attempt in range(_RETRY_TOTAL + 1):
+            if attempt:
+                await asyncio.sleep(_RETRY_BACKOFF * 2 ** (attempt - 1))
             try:
-                error_data = e.response.json()
-                msg = error_data.get("errorMessage", e.response.text)
-                header_status = error_data.get("HeaderStatusText", "")
-                return {  # noqa: TRY300
-                    "error": "APIError",
-                    "message": msg,
-                    "status_text": header_status,
-                    "http_code": e.response.status_code,
-                }
-            except (json.JSONDecodeError, AttributeError):
+                async with session.request(
+                    method,
+                    url,
+                    params=params,
+                    data=data,
+                    headers=_XHR_HEADERS,
+                    timeout=_API_TIMEOUT,
+                ) as response:
+                    if response.status == 401 or (  # noqa: PLR2004
+                        response.history and "Account/Login" in str(response.url)
+                    ):
+                        # Auth lapsed server-side; report it without reading
+                        # the body so callers can re-login.
+                        self._logged_in = False
+                        return {
+                            "error": "NotLoggedIn",
+                            "message": "Session expired.",
+                        }
+                    if response.status in _RETRY_STATUSES:
+                        last_error = await self._error_payload(response)
+                        continue
+                    if response.status >= 400:  # noqa: PLR2004
+                        return await self._error_payload(response)
+
+                    if expect_json:
+                        # Decode the raw bytes with orjson rather than
+                        # response.json(), skipping aiohttp's charset
+                        # detection and the stdlib decoder.
+                        raw = await response.read()
+                        try:
+                            return orjson.loads(raw)
+                        except orjson.JSONDecodeError:
+                            return {
+                                "raw_text": raw.decode("utf-8", "replace"),
+                                "error": "JSONDecodeError",
+                            }
+                    if discard_body:
+                        # Caller only cares about the side effect; release
+                        # the connection without decoding the body.
+                        return ""
+                    return await response.text()
+            except (aiohttp.ClientError, TimeoutError) as e:
+                last_error = {"error": "RequestException", "message": str(e)}
+                continue
+        return last_error
+
+    @staticmethod
+    async def _error_payload(response: aiohttp.ClientResponse) -> dict[str, Any]:
+        """Build the error dict for a failed API response."""
+        # Read the body exactly once; error pages are often large HTML
+        # documents, so only attempt a JSON decode when the server says
+        # the body is JSON.
+        raw = await response.read()
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.startswith("application/json"):
+            try:
+                error_data = orjson.loads(raw)
                 return {
-                    "error": "HTTPError",
-                    "message": str(e),
-                    "raw_response": e.response.text if e.response else None,
-                    "http_code": e.response.status_code if e.response else None,
+                    "error": "APIError",
+                    "message": error_data.get(
+                        "errorMessage", raw.decode("utf-8", "replace")
+                    ),
+                    "status_text": error_data.get("HeaderStatusText", ""),
+                    "http_code": response.status,
                 }
-        except requests.exceptions.RequestException as e:
-            return {"error": "RequestException", "message": str(e)}
+            except (orjson.JSONDecodeError, AttributeError):
+                pass
+        return {
+            "error": "HTTPError",
+            "message": f"HTTP {response.status}",
+            "raw_response": raw.decode("utf-8", "replace"),
+            "http_code": response.status,
+        }
 
-    def logout(self) -> str | None:
+    async def logout(self) -> None:
         """Logout from the AptusPortal."""
         logout_url = self._make_url("Account/LogOff")
 
-        logout_headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/97.0.4692.99 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,"
-            "image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Referer": self._make_url("Lock"),
-        }
-
-        try:
-            response = self.session.get(
-                logout_url, headers=logout_headers, timeout=20, allow_redirects=True
-            )
-            response.raise_for_status()
-
-            self._logged_in = False
-            self._request_verification_token = None
-            self._password_salt = None
-
-            return response.text if hasattr(response, "text") else None
-
-        except (
-            requests.exceptions.TooManyRedirects,
-            requests.exceptions.HTTPError,
-            requests.exceptions.RequestException,
-            Exception,
-        ):
-            self._logged_in = False
-            self._request_verification_token = None
-            self._password_salt = None
-            return None
-
-    def set_lock_status_temp_data(self) -> str:
-        """Set temporary data for lock status."""
-        result = self._request("GET", "Lock/SetLockStatusTempData", expect_json=False)
-        return result if isinstance(result, str) else ""
+        if self.session is not None and not self.session.closed:
+            try:
+                async with self.session.get(
+                    logout_url,
+                    headers=self._logout_headers,
+                    timeout=_PAGE_TIMEOUT,
+                    allow_redirects=False,
+                ):
+                    # No caller reads the logout page, and the redirect it
+                    # issues back to the login page carries no information,
+                    # so neither is fetched or decoded.
+                    pass
+            except (aiohttp.ClientError, TimeoutError):
+                pass
+
+        self._logged_in = False
+        self._request_verification_token = None
+        self._password_salt = None
+        self._last_temp_data_ts = None
+        self._login_expires_at = None
+
+    async def set_lock_status_temp_data(self) -> str:
+        """
+        Set temporary data for lock status.
+
+        This endpoint only matters for its side effect, so the response
+        body is discarded unread.
+        """
+        result = await self._request(
+            "GET", "Lock/SetLockStatusTempData", expect_json=False, discard_body=True
+        )
+        if isinstance(result, str):
+            self._last_temp_data_ts = time.monotonic()
+            return result
+        return ""
 
-    def get_doorman_lock_status(self) -> dict[str, Any] | None:
+    async def get_doorman_lock_status(self) -> dict[str, Any] | None:
         """Get the status of the doorman lock."""
         if not self._logged_in:
             return None
-        self.set_lock_status_temp_data()
-        result = self._request("GET", "LockAsync/DoormanLockStatus")
+        if (
+            self._last_temp_data_ts is None
+            or time.monotonic() - self._last_temp_data_ts > self._TEMP_DATA_TTL
+        ):
+            # The temp-data refresh is independent of the status read, so
+            # issue both concurrently over the keep-alive pool and pay one
+            # RTT instead of two.
+            _, result = await asyncio.gather(
+                self.set_lock_status_temp_data(),
+                self._request("GET", "LockAsync/DoormanLockStatus"),
+            )
+        else:
+            result = await self._request("GET", "LockAsync/DoormanLockStatus")
         return result if isinstance(result, dict) else None
 
-    def poll_ongoing_call(self) -> dict[str, Any]:
+    async def poll_ongoing_call(self) -> dict[str, Any]:
         """Poll for ongoing call status."""
-        result = self._request("GET", "Lock/PollOngingCall")
+        result = await self._request("GET", "Lock/PollOngingCall")
         return result if isinstance(result, dict) else {}
 
-    def unlock_entrance_door(self, lock_id: int) -> dict[str, Any]:
+    async def unlock_entrance_door(self, lock_id: int) -> dict[str, Any]:
         """Unlock the entrance door with the given lock ID."""
-        try:
-            result = self._request("GET", f"Lock/UnlockEntryDoor/{lock_id}")
-        except Exception:  # noqa: BLE001
-            # Login and retry on exception
-            self.login(self.username, self.password)
-            result = self._request("GET", f"Lock/UnlockEntryDoor/{lock_id}")
+        # Renew a nearly-expired session up front; otherwise only re-login
+        # when the portal actually rejects the session, so transient
+        # errors no longer trigger a full re-auth round trip.
+        if self._login_expiring_soon():
+            await self.login(self.username, self.password)
+
+        result = await self._request("GET", f"Lock/UnlockEntryDoor/{lock_id}")
+        if (
+            isinstance(result, dict)
+            and result.get("error") == "NotLoggedIn"
+            and await self.login(self.username, self.password)
+        ):
+            result = await self._request("GET", f"Lock/UnlockEntryDoor/{lock_id}")
 
         return result if isinstance(result, dict) else {}
 
-    def lock_doorman_lock(self) -> dict[str, Any]:
+    async def lock_doorman_lock(self) -> dict[str, Any]:
         """Lock the doorman lock."""
-        result = self._request("GET", "Lock/LockDoormanLock")
+        result = await self._request("GET", "Lock/LockDoormanLock")
         return result if isinstance(result, dict) else {}
 
-    def unlock_doorman_lock(self, code: str) -> dict[str, Any]:
+    async def unlock_doorman_lock(self, code: str) -> dict[str, Any]:
         """Unlock the doorman lock with the given code."""
-        result = self._request("GET", "Lock/UnlockDoormanLock", params={"code": code})
+        result = await self._request(
+            "GET", "Lock/UnlockDoormanLock", params={"code": code}
+        )
         return result if isinstance(result, dict) else {}
 
-    def list_available_locks(self) -> list[dict[str, int | str]] | None:
+    async def list_available_locks(self) -> list[dict[str, int | str]] | None:
         """List all available entrance locks."""
         if not self._logged_in:
             return None
 
-        original_xrw = self.session.headers.pop("X-Requested-With", None)
-        response_text = self.session.get(self._make_url("Lock")).text
-        if original_xrw:
-            self.session.headers["X-Requested-With"] = original_xrw
+        session = await self._ensure_session()
+        try:
+            # Deliberately sent without the XMLHttpRequest header so the
+            # portal renders the full Lock page.
+            async with session.get(
+                self._make_url("Lock"), timeout=_API_TIMEOUT
+            ) as response:
+                if response.status >= 400:  # noqa: PLR2004
+                    return None
+                # Both parsers accept raw bytes and sniff the charset
+                # themselves, so skip the text decode pass.
+                response_body = await response.read()
+        except (aiohttp.ClientError, TimeoutError):
+            return None
 
-        soup = BeautifulSoup(response_text, "html.parser")
-        lock_cards = soup.find_all("div", class_="lockCard")
+        locks = self._parse_locks_regex(response_body)
+        if locks:
+            return locks
+        # Zero matches: either there are no locks or the template changed,
+        # so let a real parser decide.
+        if LexborHTMLParser is not None:
+            return self._parse_locks_selectolax(response_body)
+        return self._parse_locks_lxml(response_body)
+
+    def _parse_locks_regex(self, response_body: bytes) -> list[dict[str, int | str]]:
+        """Extract the lock cards with a compiled regex (fastest path)."""
         available_locks: list[dict[str, int | str]] = []
-        for card in lock_cards:
-            if card.get("id", "").startswith("entranceDoor_"):  # type: ignore  # noqa: PGH003
-                lock_id_str = card["id"].split("_")[-1]  # type: ignore  # noqa: PGH003
-                try:
-                    lock_id = int(lock_id_str)
-                    name_div = card.find("div")  # type: ignore  # noqa: PGH003
-                    main_name = name_div.contents[0].strip()  # type: ignore  # noqa: PGH003
-                    sub_name_span = name_div.find("span")  # type: ignore  # noqa: PGH003
-                    sub_name = sub_name_span.text.strip() if sub_name_span else ""  # type: ignore  # noqa: PGH003
-                    full_name = f"{main_name} ({sub_name})" if sub_name else main_name
-                    available_locks.append(
-                        {"id": lock_id, "name": full_name, "raw_id_attr": card["id"]}  # type: ignore  # noqa: PGH003
-                    )
-                except ValueError:
-                    continue
+        for match in _LOCK_CARD_RE.finditer(response_body):
+            raw_id, lock_id, main_name, sub_name = match.groups()
+            # The DOM tiers unescape character references as part of the
+            # parse; the portal emits numeric entities for Danish names
+            # (e.g. L&#229;s), so the regex tier must unescape explicitly
+            # to yield the same names.
+            main = html.unescape(main_name.decode("utf-8", "replace")).strip()
+            sub = (
+                html.unescape(sub_name.decode("utf-8", "replace")).strip()
+                if sub_name
+                else ""
+            )
+            full_name = f"{main} ({sub})" if sub else main
+            available_locks.append(
+                {
+                    "id": int(lock_id),
+                    "name": full_name,
+                    "raw_id_attr": raw_id.decode("ascii"),
+                }
+            )
         return available_locks
 
+    def _parse_locks_selectolax(
+        self, response_body: bytes
+    ) -> list[dict[str, int | str]]:
+        """Parse the Lock page with selectolax's Lexbor backend (fast path)."""
+        tree = LexborHTMLParser(response_body)  # type: ignore  # noqa: PGH003
+        available_locks: list[dict[str, int | str]] = []
+        # The attribute-prefix selector filters inside the C parser, so Python
+        # only ever sees matching cards.
+        for card in tree.css('div.lockCard[id^="entranceDoor_"]'):
+            card_id = card.attributes.get("id") or ""
+            try:
+                lock_id = int(card_id.rsplit("_", 1)[-1])
+            except ValueError:
+                continue
+            # css_first("div") would match the card node itself (the root
+            # is included in selectolax CSS matching), so walk the direct
+            # children instead, mirroring the lxml path's card.find("div").
+            name_div = next(
+                (child for child in card.iter() if child.tag == "div"), None
+            )
+            if name_div is None:
+                continue
+            main_name = name_div.text(deep=False).strip()
+            sub_name_span = name_div.css_first("span")
+            sub_name = sub_name_span.text().strip() if sub_name_span else ""
+            full_name = f"{main_name} ({sub_name})" if sub_name else main_name
+            available_locks.append(
+                {"id": lock_id, "name": full_name, "raw_id_attr": card_id}
+            )
+        return available_locks
+
+    def _parse_locks_lxml(self, response_body: bytes) -> list[dict[str, int | str]]:
+        """
+        Parse the Lock page with lxml directly, skipping the bs4 wrapper.
+
+        One XPath traversal in C selects the entrance-door cards; bs4 only
+        remains as a last resort when lxml is missing too.
+        """
+        global _ENTRANCE_CARDS_XPATH  # noqa: PLW0603
+
+        try:
+            import lxml.html
+            from lxml.etree import XPath
+        except ImportError:
+            return self._parse_locks_bs4(response_body)
+
+        if _ENTRANCE_CARDS_XPATH is None:
+            _ENTRANCE_CARDS_XPATH = XPath(
+                '//div[contains(concat(" ", normalize-space(@class), " "),'
+                ' " lockCard ") and starts-with(@id, "entranceDoor_")]'
+            )
+
+        doc = lxml.html.fromstring(response_body)
+        available_locks: list[dict[str, int | str]] = []
+        for card in _ENTRANCE_CARDS_XPATH(doc):
+            card_id = card.get("id") or ""
+            try:
+                lock_id = int(card_id.rsplit("_", 1)[-1])
+            except ValueError:
+                continue
+            name_div = card.find("div")
+            if name_div is None:
+                continue
+            main_name = (name_div.text or "").strip()
+            sub_name_span = name_div.find("span")
+            sub_name = (
+                sub_name_span.text_content().strip()
+                if sub_name_span is not None
+                else ""
+            )
+            full_name = f"{main_name} ({sub_name})" if sub_name else main_name
+            available_locks.append(
+                {"id": lock_id, "name": full_name, "raw_id_attr": card_id}
+            )
+        return available_locks
 
-# if __name__ == "__main__":
-#     if not BeautifulSoup:
-#         print(
-#             "This script requires BeautifulSoup4 for parsing HTML"
-#             "(e.g., login page, lock list)."
-#         )
-#         print("Please install it: pip install beautifulsoup4")
-#         exit()
-
-#     # Example usage - replace with your actual credentials
-#     APTUS_USERNAME = ""
-#     APTUS_PASSWORD = ""
-#     APTUS_BASE_URL = ""
-
-#     client = AptusClient(base_url=APTUS_BASE_URL)
-
-#     print("--- Attempting Login ---")
-#     if client.login(APTUS_USERNAME, APTUS_PASSWORD):
-#         print("\nLOGIN SUCCEEDED (according to client logic)")
-
-#         if BeautifulSoup:
-#             print("\n--- Listing Available Entrance Locks ---")
-#             locks = client.list_available_locks()
-#             if isinstance(locks, list) and locks:
-#                 for lock in locks:
-#                     print(f"  ID: {lock['id']}, Name: {lock['name']}")
-#             elif isinstance(locks, str):
-#                 print(locks)
-#             else:
-#                 print("  No entrance locks found or error during listing.")
-#         else:
-#             print("\n--- Skipping lock listing (BeautifulSoup4 not installed) ---")
-
-#         print("\n--- Logging Out ---")
-#         client.logout()
-#     else:
-#         print("\nLOGIN FAILED")
-#         print("Please check your credentials and review any error messages.")
+    def _parse_locks_bs4(self, response_body: bytes) -> list[dict[str, int | str]]:
+        """Parse the Lock page with BeautifulSoup (fallback path)."""
+        _ensure_bs4()
+        soup = _BeautifulSoup(response_body, _BS4_PARSER, parse_only=_LOCK_CARDS)  # type: ignore  # noqa: PGH003
+        lock_cards = soup.find_all("div", class_="lockCard")
+        available_locks: list[dict[str, int | str]] = []
+        for card in lock_cards:
+            # Look the id attribute up once and reuse it below.
+            card_id = card.get("id") or ""  # type: ignore  # noqa: PGH003
+            if not card_id.startswith("entranceDoor_"):
+                continue
+            try:
+                lock_id = int(card_id.rsplit("_", 1)[-1])
+            except ValueError:
+                continue
+            name_div = card.find("div")  # type: ignore  # noqa: PGH003
+            main_name = name_div.contents[0].strip()  # type: ignore  # noqa: PGH003
+            sub_name_span = name_div.find("span")  # type: ignore  # noqa: PGH003
+            sub_name = sub_name_span.text.strip() if sub_name_span else ""  # type: ignore  # noqa: PGH003
+            full_name = f"{main_name} ({sub_name})" if sub_name else main_name
+            available_locks.append(
+                {"id": lock_id, "name": full_name, "raw_id_attr": card_id}
+            )
+        return available_locks
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
@@ -13,9 +13,6 @@ from homeassistant.exceptions import HomeAssistantError
 from .aptus_client import AptusClient
 from .const import DOMAIN
 
-if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
-
 _LOGGER = logging.getLogger(__name__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
@@ -27,7 +24,7 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+async def validate_input(data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     client = AptusClient(
         base_url=data[CONF_HOST],
@@ -35,18 +32,20 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         password=data[CONF_PASSWORD],
     )
 
-    # Test authentication in executor since AptusClient is synchronous
+    # AptusClient is async, so it runs directly on the event loop
     try:
-        login_success = await hass.async_add_executor_job(client.login)
+        login_success = await client.login()
         if not login_success:
             raise InvalidAuth  # noqa: TRY301
 
         # Clean up the connection
-        await hass.async_add_executor_job(client.logout)
+        await client.logout()
 
     except Exception as err:
         _LOGGER.debug("Failed to connect to Aptus Home: %s", err)
         raise CannotConnect from err
+    finally:
+        await client.close()
 
     return {"title": "Aptus Home"}
 
@@ -67,7 +66,7 @@ class AptusHomeConfigFlow(ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured()
 
             try:
-                info = await validate_input(self.hass, user_input)
+                info = await validate_input(user_input)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
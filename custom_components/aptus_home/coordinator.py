@@ -0,0 +1,67 @@
+"""Data update coordinator for the Aptus Home integration."""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from . import AptusHomeConfigEntry
+    from .aptus_client import AptusClient
+
+_LOGGER = logging.getLogger(__name__)
+
+UPDATE_INTERVAL = timedelta(seconds=30)
+
+
+class AptusHomeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Poll the AptusPortal once per cycle on behalf of all entities."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: AptusHomeConfigEntry,
+        client: AptusClient,
+    ) -> None:
+        """Initialize the coordinator with the config entry and shared client."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=DOMAIN,
+            update_interval=UPDATE_INTERVAL,
+        )
+        self.client = client
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """
+        Fetch the doorman lock status shared by every lock entity.
+
+        The entrance locks expose no readable state, so the payload itself
+        is not fed into entity state; the poll exists to keep the portal
+        session warm and to drive entity availability. Raising UpdateFailed
+        on error payloads lets the coordinator flag and recover from auth
+        loss instead of silently storing it as data.
+        """
+        result = await self.client.get_doorman_lock_status()
+        if result is None or result.get("error") == "NotLoggedIn":
+            # The session lapsed; re-login once so a cookie expiry heals
+            # without user interaction before failing the cycle.
+            if not await self.client.login():
+                msg = "AptusPortal session expired and re-login failed"
+                raise UpdateFailed(msg)
+            result = await self.client.get_doorman_lock_status()
+        if result is None:
+            msg = "AptusPortal returned no lock status"
+            raise UpdateFailed(msg)
+        if result.get("error"):
+            msg = f"AptusPortal error: {result.get('message', result['error'])}"
+            raise UpdateFailed(msg)
+        return result
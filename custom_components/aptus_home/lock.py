@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import logging
-import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.lock import LockEntity
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import AptusHomeCoordinator
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from . import AptusHomeConfigEntry
@@ -18,53 +24,38 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001
     entry: AptusHomeConfigEntry,
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Aptus Home lock entities."""
-    client = entry.runtime_data
+    coordinator = entry.runtime_data
 
     # Get available locks from the client
-    locks_data = await hass.async_add_executor_job(client.list_available_locks)  # type: ignore  # noqa: PGH003
+    locks_data = await coordinator.client.list_available_locks()
     if isinstance(locks_data, list):
-        entities = [AptusHomeLock(client, lock_info) for lock_info in locks_data]
+        entities = [AptusHomeLock(coordinator, lock_info) for lock_info in locks_data]
         async_add_entities(entities)
     else:
         _LOGGER.warning("Could not retrieve locks: %s", locks_data)
 
 
-class AptusHomeLock(LockEntity):
+class AptusHomeLock(CoordinatorEntity[AptusHomeCoordinator], LockEntity):
     """Representation of an Aptus Home lock."""
 
-    def __init__(self, client, lock_info: dict[str, Any]) -> None:  # noqa: ANN001
+    def __init__(
+        self, coordinator: AptusHomeCoordinator, lock_info: dict[str, Any]
+    ) -> None:
         """Initialize the lock."""
-        self._client = client
+        super().__init__(coordinator)
+        self._client = coordinator.client
         self._lock_info = lock_info
         self._attr_name = lock_info["name"]
         self._attr_unique_id = f"aptus_lock_{lock_info['id']}"
         self._lock_id = lock_info["id"]
-        self._attr_is_locked = None
-        self._unlock_time: float | None = None
+        self._attr_is_locked = True
         self._unlock_duration = 5.0  # Door stays unlocked for 5 seconds
-
-    @property
-    def is_locked(self) -> bool | None:
-        """Return true if the lock is locked."""
-        return self._attr_is_locked
-
-    async def async_update(self) -> None:
-        """Fetch new state data for this lock."""
-        # Check if door should still be unlocked
-        if self._unlock_time is not None:
-            time_since_unlock = time.time() - self._unlock_time
-            if time_since_unlock < self._unlock_duration:
-                self._attr_is_locked = False
-            else:
-                self._attr_is_locked = True
-                self._unlock_time = None  # Reset unlock time
-        else:
-            self._attr_is_locked = True
+        self._relock_unsub: CALLBACK_TYPE | None = None
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the device."""
@@ -72,16 +63,34 @@ class AptusHomeLock(LockEntity):
 
     async def async_unlock(self) -> None:
         """Unlock the device."""
-        result = await self.hass.async_add_executor_job(
-            self._client.unlock_entrance_door, self._lock_id
-        )
+        result = await self._client.unlock_entrance_door(self._lock_id)
         if result.get("error"):
             _LOGGER.error("Failed to unlock: %s", result.get("message"))
-        else:
-            # Set unlock time to simulate door being unlocked
-            self._unlock_time = time.time()
-            self._attr_is_locked = False
-            _LOGGER.debug(
-                "Door unlocked, will automatically lock in %s seconds",
-                self._unlock_duration,
-            )
+            return
+
+        # The entrance door re-locks itself; schedule a single callback to
+        # flip the state back instead of re-deriving it on every update.
+        self._attr_is_locked = False
+        self.async_write_ha_state()
+        if self._relock_unsub:
+            self._relock_unsub()
+        self._relock_unsub = async_call_later(
+            self.hass, self._unlock_duration, self._relock
+        )
+        _LOGGER.debug(
+            "Door unlocked, will automatically lock in %s seconds",
+            self._unlock_duration,
+        )
+
+    @callback
+    def _relock(self, _now: datetime) -> None:
+        """Flip the simulated state back to locked."""
+        self._relock_unsub = None
+        self._attr_is_locked = True
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending relock callback on removal."""
+        if self._relock_unsub:
+            self._relock_unsub()
+            self._relock_unsub = None